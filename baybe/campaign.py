@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import gc
-import json
 from collections.abc import Callable, Collection
 from functools import reduce
 from typing import TYPE_CHECKING, Any
@@ -33,6 +32,7 @@ from baybe.searchspace.core import (
     validate_searchspace_from_config,
 )
 from baybe.serialization import SerialMixin, converter
+from baybe.serialization.utils import load_json
 from baybe.surrogates.base import SurrogateProtocol
 from baybe.targets.base import Target
 from baybe.telemetry import (
@@ -241,7 +241,7 @@ class Campaign(SerialMixin):
         Returns:
             The constructed campaign.
         """
-        config = json.loads(config_json)
+        config = load_json(config_json)
         return converter.structure(config, Campaign)
 
     @classmethod
@@ -251,7 +251,7 @@ class Campaign(SerialMixin):
         Args:
             config_json: The JSON that should be validated.
         """
-        config = json.loads(config_json)
+        config = load_json(config_json)
         _validation_converter.structure(config, Campaign)
 
     def add_measurements(
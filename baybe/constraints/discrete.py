@@ -345,9 +345,11 @@ class DiscreteCustomConstraint(DiscreteConstraint):
 
     # object variables
     validator: Callable[[pd.DataFrame], pd.Series] = field()
-    """A user-defined function modeling the validation of the constraint. The expected
-    return is a pandas series with Boolean entries True/False for search space elements
-    you want to keep/remove."""
+    """A user-defined function modeling the validation of the constraint. The function
+    receives all candidates to be checked as a single dataframe restricted to the
+    constraint parameters, so it should use vectorized column operations instead of
+    row-wise ``apply``. The expected return is a pandas series with Boolean entries
+    True/False for search space elements you want to keep/remove."""
 
     @override
     def get_invalid(self, data: pd.DataFrame) -> pd.Index:
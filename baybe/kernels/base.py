@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import gc
 from abc import ABC
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
-from attrs import define
+from attrs import define, fields
 
 from baybe.exceptions import UnmatchedAttributeError
 from baybe.priors.base import Prior
@@ -16,7 +17,7 @@ from baybe.serialization.core import (
     unstructure_base,
 )
 from baybe.serialization.mixin import SerialMixin
-from baybe.utils.basic import get_baseclasses, match_attributes
+from baybe.utils.basic import get_baseclasses, get_init_parameters
 
 if TYPE_CHECKING:
     import torch
@@ -42,7 +43,8 @@ class Kernel(ABC, SerialMixin):
         active_dims: tuple[int, ...] | None = None,
     ):
         """Create the gpytorch representation of the kernel."""
-        import gpytorch.kernels
+        # NOTE: The result is not memoized since the returned module holds trainable
+        #   parameters that are modified in-place during model fitting.
 
         # Extract keywords with non-default values. This is required since gpytorch
         # makes use of kwargs, i.e. differentiates if certain keywords are explicitly
@@ -53,29 +55,9 @@ class Kernel(ABC, SerialMixin):
         )
         kw = {k: v for k, v in kw.items() if v is not None}
 
-        # Get corresponding gpytorch kernel class and its base classes
-        kernel_cls = getattr(gpytorch.kernels, self.__class__.__name__)
-        base_classes = get_baseclasses(kernel_cls, abstract=True)
-
-        # Fetch the necessary gpytorch constructor parameters of the kernel.
-        # NOTE: In gpytorch, some attributes (like the kernel lengthscale) are handled
-        #   via the `gpytorch.kernels.Kernel` base class. Hence, it is not sufficient to
-        #   just check the fields of the actual class, but also those of its base
-        #   classes.
-        kernel_attrs: dict[str, Any] = {}
-        unmatched_attrs: dict[str, Any] = {}
-        for cls in [kernel_cls, *base_classes]:
-            matched, unmatched = match_attributes(self, cls.__init__, strict=False)
-            kernel_attrs.update(matched)
-            unmatched_attrs.update(unmatched)
-
-        # Sanity check: all attributes of the BayBE kernel need a corresponding match
-        # in the gpytorch kernel (otherwise, the BayBE kernel class is misconfigured).
-        # Exception: initial values are not used during construction but are set
-        # on the created object (see code at the end of the method).
-        missing = set(unmatched) - set(kernel_attrs)
-        if leftover := {m for m in missing if not m.endswith("_initial_value")}:
-            raise UnmatchedAttributeError(leftover)
+        # Get corresponding gpytorch kernel class and the matching attributes
+        kernel_cls, attr_names = _get_gpytorch_kernel_attributes(self.__class__)
+        kernel_attrs: dict[str, Any] = {n: getattr(self, n) for n in attr_names}
 
         # Convert specified priors to gpytorch, if provided
         prior_dict = {
@@ -125,6 +107,51 @@ class CompositeKernel(Kernel, ABC):
     """Abstract base class for all composite kernels."""
 
 
+@cache
+def _get_gpytorch_kernel_attributes(
+    cls: type[Kernel], /
+) -> tuple[type, frozenset[str]]:
+    """Resolve the gpytorch counterpart of a kernel class and its matching attributes.
+
+    Args:
+        cls: The BayBE kernel class.
+
+    Raises:
+        UnmatchedAttributeError: If the kernel class has attributes that cannot be
+            matched to a constructor parameter of the gpytorch kernel class.
+
+    Returns:
+        * The corresponding gpytorch kernel class.
+        * The names of the kernel attributes to be passed to its constructor.
+    """
+    import gpytorch.kernels
+
+    # Get corresponding gpytorch kernel class and its base classes
+    kernel_cls = getattr(gpytorch.kernels, cls.__name__)
+    base_classes = get_baseclasses(kernel_cls, abstract=True)
+
+    # Fetch the necessary gpytorch constructor parameters of the kernel.
+    # NOTE: In gpytorch, some attributes (like the kernel lengthscale) are handled
+    #   via the `gpytorch.kernels.Kernel` base class. Hence, it is not sufficient to
+    #   just check the fields of the actual class, but also those of its base
+    #   classes.
+    parameters = set().union(
+        *(get_init_parameters(c) for c in [kernel_cls, *base_classes])
+    )
+    attributes = {a.name for a in fields(cls)}
+    matched = attributes & parameters
+
+    # Sanity check: all attributes of the BayBE kernel need a corresponding match
+    # in the gpytorch kernel (otherwise, the BayBE kernel class is misconfigured).
+    # Exception: initial values are not used during construction but are set
+    # on the created object (see code at the end of `Kernel.to_gpytorch`).
+    missing = attributes - matched
+    if leftover := {m for m in missing if not m.endswith("_initial_value")}:
+        raise UnmatchedAttributeError(leftover)
+
+    return kernel_cls, frozenset(matched)
+
+
 # Register (un-)structure hooks
 converter.register_structure_hook(Kernel, get_base_structure_hook(Kernel))
 converter.register_unstructure_hook(Kernel, unstructure_base)
@@ -2,16 +2,18 @@
 
 import gc
 from abc import ABC
+from functools import cache
 
-from attrs import define
+from attrs import define, fields
 
+from baybe.exceptions import UnmatchedAttributeError
 from baybe.serialization.core import (
     converter,
     get_base_structure_hook,
     unstructure_base,
 )
 from baybe.serialization.mixin import SerialMixin
-from baybe.utils.basic import match_attributes
+from baybe.utils.basic import get_init_parameters
 
 
 @define(frozen=True)
@@ -20,7 +22,6 @@ class Prior(ABC, SerialMixin):
 
     def to_gpytorch(self, *args, **kwargs):
         """Create the gpytorch representation of the prior."""
-        import gpytorch.priors
         import torch
 
         from baybe.utils.torch import DTypeFloatTorch
@@ -30,8 +31,8 @@ class Prior(ABC, SerialMixin):
         #   so that the dtype is set whenever torch is lazily loaded.
         torch.set_default_dtype(DTypeFloatTorch)
 
-        prior_cls = getattr(gpytorch.priors, self.__class__.__name__)
-        fields_dict = match_attributes(self, prior_cls.__init__)[0]
+        prior_cls, attr_names = _get_gpytorch_prior_attributes(self.__class__)
+        fields_dict = {name: getattr(self, name) for name in attr_names}
 
         # Update kwargs to contain class-specific attributes
         kwargs.update(fields_dict)
@@ -39,6 +40,33 @@ class Prior(ABC, SerialMixin):
         return prior_cls(*args, **kwargs)
 
 
+@cache
+def _get_gpytorch_prior_attributes(cls: type[Prior], /) -> tuple[type, frozenset[str]]:
+    """Resolve the gpytorch counterpart of a prior class and its matching attributes.
+
+    Args:
+        cls: The BayBE prior class.
+
+    Raises:
+        UnmatchedAttributeError: If the prior class has attributes that cannot be
+            matched to a constructor parameter of the gpytorch prior class.
+
+    Returns:
+        * The corresponding gpytorch prior class.
+        * The names of the prior attributes to be passed to its constructor.
+    """
+    import gpytorch.priors
+
+    prior_cls = getattr(gpytorch.priors, cls.__name__)
+    attributes = frozenset(a.name for a in fields(cls))
+    if unmatched := attributes - get_init_parameters(prior_cls):
+        raise UnmatchedAttributeError(
+            f"The following attributes cannot be matched: {set(unmatched)}."
+        )
+
+    return prior_cls, attributes
+
+
 # Register (un-)structure hooks
 converter.register_structure_hook(Prior, get_base_structure_hook(Prior))
 converter.register_unstructure_hook(Prior, unstructure_base)
@@ -64,6 +64,10 @@ def get_base_structure_hook(
     """
     # TODO: use include_subclasses (https://github.com/python-attrs/cattrs/issues/434)
 
+    # Subclasses resolved so far, indexed by the name/abbreviation used for lookup.
+    # This avoids scanning the entire class hierarchy on every structuring call.
+    resolved: dict[str, type[_T]] = {}
+
     def structure_base(val: dict | str, cls: type[_T]) -> _T:
         # If the given class can be instantiated, only ensure there is no conflict with
         # a potentially specified type field
@@ -79,7 +83,10 @@ def get_base_structure_hook(
         # the corresponding class in the hierarchy
         else:
             type_ = val if isinstance(val, str) else val.pop("type")
-            concrete_cls = find_subclass(base, type_)
+            if not isinstance(type_, str):
+                concrete_cls = find_subclass(base, type_)
+            elif (concrete_cls := resolved.get(type_)) is None:
+                concrete_cls = resolved[type_] = find_subclass(base, type_)
 
         # Create the structuring function for the class and call it
         fn = make_dict_structure_fn(
@@ -4,6 +4,7 @@ import json
 from typing import TypeVar
 
 from baybe.serialization.core import converter
+from baybe.serialization.utils import load_json
 
 _T = TypeVar("_T")
 
@@ -49,4 +50,4 @@ class SerialMixin:
         Returns:
             The reconstructed object.
         """
-        return cls.from_dict(json.loads(string))
+        return cls.from_dict(load_json(string))
@@ -1,9 +1,12 @@
 """A collection of serialization utilities."""
 
+import json
 from typing import Any
 
 import pandas as pd
 
+from baybe._optional.info import ORJSON_INSTALLED
+
 
 def serialize_dataframe(df: pd.DataFrame, /) -> Any:
     """Serialize a pandas dataframe."""
@@ -17,3 +20,21 @@ def deserialize_dataframe(serialized_df: Any, /) -> pd.DataFrame:
     from baybe.searchspace.core import converter
 
     return converter.structure(serialized_df, pd.DataFrame)
+
+
+def load_json(string: str, /) -> Any:
+    """Parse a JSON string, using the faster :mod:`orjson` parser if available.
+
+    Because :mod:`orjson` strictly follows the JSON specification, inputs containing
+    non-standard literals (such as ``NaN`` or ``Infinity``, which :func:`json.dumps`
+    produces for non-finite floats) are handed over to :func:`json.loads` instead.
+    """
+    if ORJSON_INSTALLED:
+        import orjson
+
+        try:
+            return orjson.loads(string)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(string)
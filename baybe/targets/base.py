@@ -41,6 +41,9 @@ class Target(ABC, SerialMixin):
     def transform(self, series: pd.Series, /) -> pd.Series:
         """Transform target measurements to computational representation.
 
+        The provided series is not modified, i.e., the transformed values are always
+        returned as a new series.
+
         Args:
             series: The target measurements in experimental representation to be
                 transformed.
@@ -13,6 +13,7 @@ from typing_extensions import override
 from baybe.exceptions import InvalidTargetValueError
 from baybe.serialization import SerialMixin
 from baybe.targets.base import Target
+from baybe.utils.numerical import DTypeFloatNumpy
 from baybe.utils.validation import validate_not_nan
 
 ChoiceValue: TypeAlias = bool | int | float | str
@@ -79,10 +80,12 @@ class BinaryTarget(Target, SerialMixin):
         assert isinstance(series, pd.Series)
         # <<<<<<<<<< Deprecation
 
+        # Identify the choice values (the masks are reused for the transformation)
+        success = (series == self.success_value).to_numpy(dtype=bool, na_value=False)
+        failure = (series == self.failure_value).to_numpy(dtype=bool, na_value=False)
+
         # Validate target values
-        invalid = series[
-            ~series.isin([self.success_value, self.failure_value]).to_numpy()
-        ]
+        invalid = series[~(success | failure)]
         if len(invalid) > 0:
             raise InvalidTargetValueError(
                 f"The following values entered for target '{self.name}' are not in the "
@@ -91,11 +94,11 @@ class BinaryTarget(Target, SerialMixin):
             )
 
         # Transform
-        success_idx = series == self.success_value
         return pd.Series(
-            np.where(success_idx, _SUCCESS_VALUE_COMP, _FAILURE_VALUE_COMP),
+            np.where(success, _SUCCESS_VALUE_COMP, _FAILURE_VALUE_COMP),
             index=series.index,
             name=series.name,
+            dtype=DTypeFloatNumpy,
         )
 
     @override
@@ -202,6 +202,21 @@ def match_attributes(
     return attrs_in_signature, attrs_not_in_signature
 
 
+@functools.cache
+def get_init_parameters(cls: type, /) -> frozenset[str]:
+    """Get the names of the parameters accepted by the constructor of a class.
+
+    Since :func:`inspect.signature` is comparably slow, the result is cached per class.
+
+    Args:
+        cls: The class whose constructor signature is to be inspected.
+
+    Returns:
+        The names of the constructor parameters (excluding ``self``).
+    """
+    return frozenset(inspect.signature(cls.__init__).parameters) - {"self"}
+
+
 class classproperty:
     """A decorator to make class properties.
 
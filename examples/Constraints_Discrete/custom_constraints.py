@@ -62,34 +62,36 @@ parameters = [solvent, speed, temperature, concentration]
 
 # The constraints are handled when creating the searchspace object.
 # We thus need to define our constraint first as follows.
+# Note that our function operates on entire dataframe columns rather than single rows.
 
 
 def custom_function(df: pd.DataFrame) -> pd.Series:
     """This constraint implements a custom user-defined filter/validation functionality."""  # noqa: D401
+    solvent = df["Solvent"].to_numpy()
+    temperature = df["Temperature"].to_numpy()
+    concentration = df["Concentration"].to_numpy()
+
+    # Precompute the solvent masks used in the individual situations
+    is_water = solvent == "water"
+    is_c2 = solvent == "C2"
+    is_c3 = solvent == "C3"
+
     # Situation 1: We only want entries where the solvent water is used with
     # temperatures <= 120 and concentrations <= 5
-    mask_bad1 = (
-        (df["Solvent"] == "water")
-        & (df["Temperature"] > 120)
-        & (df["Concentration"] > 5)
-    )
+    mask_bad1 = is_water & (temperature > 120) & (concentration > 5)
 
     # Situation 2: We only want entries where the solvent C2 is used with
     # temperatures <= 180 and concentrations <= 3
-    mask_bad2 = (
-        (df["Solvent"] == "C2") & (df["Temperature"] > 180) & (df["Concentration"] > 3)
-    )
+    mask_bad2 = is_c2 & (temperature > 180) & (concentration > 3)
 
     # Situation 3: We only want entries where the solvent C3 is used with
     # temperatures <= 150 and concentrations <= 3
-    mask_bad3 = (
-        (df["Solvent"] == "C3") & (df["Temperature"] > 150) & (df["Concentration"] > 3)
-    )
+    mask_bad3 = is_c3 & (temperature > 150) & (concentration > 3)
 
     # Combine all situations
     mask_good = ~(mask_bad1 | mask_bad2 | mask_bad3)
 
-    return mask_good
+    return pd.Series(mask_good, index=df.index)
 
 
 # We now initialize the `CustomConstraint` with all parameters this function should have access to.
@@ -118,41 +120,21 @@ for kIter in range(N_ITERATIONS):
     print(f"\n\n#### ITERATION {kIter+1} ####")
 
     print("## ASSERTS ##")
+    df = campaign.searchspace.discrete.exp_rep
+    solvents = df["Solvent"].to_numpy()
+    temperatures = df["Temperature"].to_numpy()
+    concentrations = df["Concentration"].to_numpy()
     print(
         "Number of entries with water, temp > 120 and concentration > 5:      ",
-        (
-            campaign.searchspace.discrete.exp_rep["Concentration"].apply(
-                lambda x: x > 5
-            )
-            & campaign.searchspace.discrete.exp_rep["Temperature"].apply(
-                lambda x: x > 120
-            )
-            & campaign.searchspace.discrete.exp_rep["Solvent"].eq("water")
-        ).sum(),
+        ((concentrations > 5) & (temperatures > 120) & (solvents == "water")).sum(),
     )
     print(
         "Number of entries with C2, temp > 180 and concentration > 3:         ",
-        (
-            campaign.searchspace.discrete.exp_rep["Concentration"].apply(
-                lambda x: x > 3
-            )
-            & campaign.searchspace.discrete.exp_rep["Temperature"].apply(
-                lambda x: x > 180
-            )
-            & campaign.searchspace.discrete.exp_rep["Solvent"].eq("C2")
-        ).sum(),
+        ((concentrations > 3) & (temperatures > 180) & (solvents == "C2")).sum(),
     )
     print(
         "Number of entries with C3, temp > 150 and concentration > 3:         ",
-        (
-            campaign.searchspace.discrete.exp_rep["Concentration"].apply(
-                lambda x: x > 3
-            )
-            & campaign.searchspace.discrete.exp_rep["Temperature"].apply(
-                lambda x: x > 150
-            )
-            & campaign.searchspace.discrete.exp_rep["Solvent"].eq("C3")
-        ).sum(),
+        ((concentrations > 3) & (temperatures > 150) & (solvents == "C3")).sum(),
     )
 
     rec = campaign.recommend(batch_size=5)
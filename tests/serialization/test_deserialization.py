@@ -7,11 +7,17 @@ NOTE: The tests are based on `AcquisitionFunction` simply because the class prov
     `abbreviation` variable that is necessary for the tests.
 """
 
+import json
+
 import pytest
 from pytest import param
 
 from baybe.acquisition.acqfs import UpperConfidenceBound
 from baybe.acquisition.base import AcquisitionFunction
+from baybe.exceptions import UnidentifiedSubclassError
+from baybe.kernels.base import Kernel
+from baybe.serialization import utils
+from baybe.serialization.utils import load_json
 
 
 @pytest.mark.parametrize(
@@ -70,9 +76,71 @@ def test_valid_deserialization(cls, dct):
             "'UpperConfidenceBound' .* does not match .* 'wrong'",
             id="inconsistent-type",
         ),
+        param(
+            AcquisitionFunction,
+            {"type": "wrong", "beta": 1337},
+            UnidentifiedSubclassError,
+            "'wrong' does not refer to any",
+            id="unknown-type",
+        ),
     ],
 )
 def test_invalid_deserialization(cls, dct, err, msg):
     """Incorrect type information throws the correct error."""
     with pytest.raises(err, match=msg):
         cls.from_dict(dct)
+
+
+@pytest.mark.parametrize(
+    "type_", [["MaternKernel"], {"name": "MaternKernel"}], ids=["list", "dict"]
+)
+def test_malformed_type_deserialization(type_):
+    """Non-string type information throws the correct error."""
+    # NOTE: `Kernel` is used since the deprecation hook registered for
+    #   `AcquisitionFunction` expects string-based type information
+    with pytest.raises(UnidentifiedSubclassError, match="does not refer to any"):
+        Kernel.from_dict({"type": type_})
+
+
+@pytest.mark.parametrize("type_", ["UpperConfidenceBound", "UCB"])
+def test_repeated_deserialization(type_):
+    """Repeatedly deserializing via the base class yields consistent results."""
+    for _ in range(2):
+        acqf = AcquisitionFunction.from_dict({"type": type_, "beta": 1337})
+        assert acqf == UpperConfidenceBound(beta=1337)
+
+
+@pytest.mark.parametrize("beta", [1337.0, float("inf")], ids=["finite", "non-finite"])
+def test_json_deserialization(beta):
+    """Deserialization from JSON works, including non-standard float literals."""
+    acqf = UpperConfidenceBound(beta=beta)
+    assert acqf == AcquisitionFunction.from_json(acqf.to_json())
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Parametrize the JSON parsing backend used by `load_json`."""
+    if request.param:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(utils, "ORJSON_INSTALLED", request.param)
+
+
+@pytest.mark.usefixtures("json_backend")
+@pytest.mark.parametrize(
+    "string",
+    [
+        param('{"a": 1.5, "b": [1, "x", null, true]}', id="finite"),
+        param('{"a": NaN, "b": Infinity, "c": -Infinity}', id="non-finite"),
+    ],
+)
+def test_load_json(string):
+    """Both JSON backends produce the same result as the standard library."""
+    # Comparing the re-serialized strings also covers NaN, which is unequal to itself
+    assert json.dumps(load_json(string)) == json.dumps(json.loads(string))
+
+
+@pytest.mark.usefixtures("json_backend")
+def test_load_invalid_json():
+    """Invalid JSON raises the standard library error for both backends."""
+    with pytest.raises(json.JSONDecodeError):
+        load_json('{"a": ')
@@ -4,8 +4,8 @@ from typing import Any
 
 import numpy as np
 import torch
-from attrs import asdict, has
-from hypothesis import given
+from attrs import fields, has
+from hypothesis import given, settings
 
 from baybe.kernels.base import BasicKernel, Kernel
 
@@ -26,47 +26,61 @@ def validate_gpytorch_kernel_components(obj: Any, mapped: Any, **kwargs) -> None
         mapped: The corresponding object in the translated GPyTorch kernel.
         **kwargs: Optional kernel arguments that were passed to the GPyTorch kernel.
     """
-    # Assert that the kernel kwargs are correctly mapped
-    if isinstance(obj, BasicKernel):
-        for k, v in kwargs.items():
-            assert torch.tensor(getattr(mapped, k)).equal(torch.tensor(v))
-
-    # Compare attribute by attribute
-    for name, component in asdict(obj, recurse=False).items():
-        # If the BayBE component is `None`, the GPyTorch component might not even
-        # exist, so we skip
-        if component is None:
-            continue
-
-        # Resolve attribute naming differences
-        mapped_name = _RENAME_DICT.get(name, name)
-
-        # If the attribute does not exist in the GPyTorch version, it must be an
-        # initial value. Because setting initial values involves going through
-        # constraint transformations on GPyTorch side (i.e., difference between
-        # `<attr>` and `raw_<attr>`), the numerical values will not be exact, so
-        # we check only for approximate matches.
-        if (mapped_component := getattr(mapped, mapped_name, None)) is None:
-            assert name.endswith("_initial_value")
-            assert np.allclose(
-                component,
-                getattr(mapped, name.removesuffix("_initial_value")).detach().numpy(),
-            )
-
-        # If the component is itself another attrs object, recurse
-        elif has(component):
-            validate_gpytorch_kernel_components(component, mapped_component, **kwargs)
-
-        # Same for collections of BayBE objects (coming from composite kernels)
-        elif isinstance(component, tuple) and all(has(c) for c in component):
-            for c, m in zip(component, mapped_component):
-                validate_gpytorch_kernel_components(c, m, **kwargs)
-
-        # On the lowest component level, simply check for equality
-        else:
-            assert component == mapped_component
-
-
+    # Traverse the (possibly nested) kernel structure using a stack of
+    # corresponding BayBE/GPyTorch object pairs
+    stack = [(obj, mapped)]
+    while stack:
+        current, current_mapped = stack.pop()
+
+        # Assert that the kernel kwargs are correctly mapped
+        if isinstance(current, BasicKernel):
+            for k, v in kwargs.items():
+                assert torch.tensor(getattr(current_mapped, k)).equal(torch.tensor(v))
+
+        # Compare attribute by attribute
+        for attribute in fields(type(current)):
+            name = attribute.name
+            component = getattr(current, name)
+
+            # If the BayBE component is `None`, the GPyTorch component might not even
+            # exist, so we skip
+            if component is None:
+                continue
+
+            # Resolve attribute naming differences
+            mapped_name = _RENAME_DICT.get(name, name)
+
+            # If the attribute does not exist in the GPyTorch version, it must be an
+            # initial value. Because setting initial values involves going through
+            # constraint transformations on GPyTorch side (i.e., difference between
+            # `<attr>` and `raw_<attr>`), the numerical values will not be exact, so
+            # we check only for approximate matches.
+            if (mapped_component := getattr(current_mapped, mapped_name, None)) is None:
+                assert name.endswith("_initial_value")
+                assert np.allclose(
+                    component,
+                    getattr(current_mapped, name.removesuffix("_initial_value"))
+                    .detach()
+                    .numpy(),
+                )
+
+            # If the component is itself another attrs object, validate it as well
+            elif has(component):
+                stack.append((component, mapped_component))
+
+            # Same for collections of BayBE objects (coming from composite kernels)
+            elif isinstance(component, tuple) and all(has(c) for c in component):
+                stack.extend(zip(component, mapped_component))
+
+            # On the lowest component level, simply check for equality
+            else:
+                assert component == mapped_component
+
+
+# NOTE: The first examples pay one-time costs (lazy gpytorch imports and the per-class
+#   caching of the gpytorch class introspection), which would otherwise make the
+#   runtime-based deadline flaky
+@settings(deadline=None)
 @given(kernels())
 def test_kernel_assembly(kernel: Kernel):
     """Turning a BayBE kernel into a GPyTorch kernel raises no errors and all its
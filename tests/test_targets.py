@@ -0,0 +1,36 @@
+"""Target tests."""
+
+import pandas as pd
+import pytest
+from pytest import param
+
+from baybe.exceptions import InvalidTargetValueError
+from baybe.targets.binary import BinaryTarget
+from baybe.utils.numerical import DTypeFloatNumpy
+
+_DTYPES = [
+    param(object, id="object"),
+    param(bool, id="bool"),
+    param("boolean", id="nullable"),
+]
+
+
+@pytest.mark.parametrize("dtype", _DTYPES)
+def test_binary_target_transform(dtype):
+    """Binary measurements are mapped to 1/0 in the configured float precision."""
+    series = pd.Series([True, False, False, True], index=[3, 1, 4, 2], name="t")
+    transformed = BinaryTarget("t").transform(series.astype(dtype))
+
+    assert transformed.dtype == DTypeFloatNumpy
+    assert transformed.name == "t"
+    assert transformed.index.equals(series.index)
+    assert transformed.tolist() == [1.0, 0.0, 0.0, 1.0]
+
+
+@pytest.mark.parametrize("dtype", _DTYPES)
+def test_binary_target_transform_invalid_value(dtype):
+    """Values other than the choice values raise an error."""
+    target = BinaryTarget("t", success_value="yes", failure_value="no")
+    series = pd.Series([True, False]).astype(dtype)
+    with pytest.raises(InvalidTargetValueError):
+        target.transform(series)
@@ -3,7 +3,7 @@
 import pytest
 from pytest import param
 
-from baybe.utils.basic import register_hooks
+from baybe.utils.basic import get_init_parameters, register_hooks
 
 
 def f_plain(arg1, arg2):
@@ -61,3 +61,13 @@ def test_invalid_register_hooks(target, hook):
     """Passing inconsistent signatures to `register_hooks` raises an error."""
     with pytest.raises(TypeError):
         register_hooks(target, [hook])
+
+
+class _WithInit:
+    def __init__(self, arg1, arg2=1, *args, **kwargs):
+        pass
+
+
+def test_get_init_parameters():
+    """The constructor parameter names are extracted without `self`."""
+    assert get_init_parameters(_WithInit) == {"arg1", "arg2", "args", "kwargs"}
@@ -1,8 +1,10 @@
 """Validation tests for targets."""
 
+import pandas as pd
 import pytest
 from pytest import param
 
+from baybe.exceptions import InvalidTargetValueError
 from baybe.targets.binary import BinaryTarget
 from baybe.targets.numerical import NumericalTarget
 
@@ -55,6 +57,21 @@ def test_binary_target_invalid_values(choices, error, match):
         )
 
 
+@pytest.mark.parametrize(
+    ("series", "choices"),
+    [
+        param(pd.Series([True, pd.NA], dtype="boolean"), (True, False), id="boolean"),
+        param(pd.Series([1, pd.NA], dtype="Int64"), (1, 0), id="Int64"),
+        param(pd.Series([True, pd.NA], dtype=object), (True, False), id="object"),
+    ],
+)
+def test_binary_target_missing_measurements(series, choices):
+    """Missing values in nullable measurement series are reported as invalid."""
+    target = BinaryTarget("t", success_value=choices[0], failure_value=choices[1])
+    with pytest.raises(InvalidTargetValueError, match="<NA>"):
+        target.transform(series)
+
+
 @pytest.mark.parametrize(
     "mode",
     ["MIN", "MAX"],